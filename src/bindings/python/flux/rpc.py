@@ -8,7 +8,13 @@
 # SPDX-License-Identifier: LGPL-3.0
 ###############################################################
 
-import json
+#  orjson parses JSON directly from bytes and is significantly faster than
+#  the stdlib parser.  Fall back to stdlib json (which also accepts bytes)
+#  if orjson is not installed.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 import flux.constants
 from flux.core.inner import ffi, lib, raw
@@ -16,6 +22,11 @@ from flux.future import Future
 from flux.util import check_future_error, encode_payload, encode_topic, interruptible
 from flux.wrapper import Wrapper
 
+#  cffi type of the output parameter of flux_rpc_get(), parsed once here
+#  instead of on every response fetch.  The box itself is still allocated
+#  per call since responses may be fetched from concurrent callbacks.
+_CHAR_PP = ffi.typeof("char *[1]")
+
 
 class RPC(Future):
     """An RPC state object"""
@@ -29,10 +40,9 @@ class RPC(Future):
             prefixes=None,
             destructor=raw.flux_future_destroy,
         ):
-            # avoid using a static list as a default argument
-            # pylint error 'dangerous-default-value'
+            # default applied here so callers may pass prefixes=None
             if prefixes is None:
-                prefixes = ["flux_rpc_", "flux_future_"]
+                prefixes = ("flux_rpc_", "flux_future_")
 
             super().__init__(
                 ffi, lib, handle, match, filter_match, prefixes, destructor
@@ -61,13 +71,13 @@ class RPC(Future):
         future_handle = raw.flux_rpc(flux_handle, topic, payload, nodeid, flags)
         super(RPC, self).__init__(
             future_handle,
-            prefixes=["flux_rpc_", "flux_future_"],
+            prefixes=("flux_rpc_", "flux_future_"),
             pimpl_t=self.RPCInnerWrapper,
         )
 
     @interruptible
-    def get_str(self):
-        payload_str = ffi.new("char *[1]")
+    def _get_bytes(self):
+        payload_str = ffi.new(_CHAR_PP)
         try:
             self.pimpl.flux_rpc_get(payload_str)
         except OSError:
@@ -75,10 +85,16 @@ class RPC(Future):
             raise
         if payload_str[0] == ffi.NULL:
             return None
-        return ffi.string(payload_str[0]).decode("utf-8")
+        return ffi.string(payload_str[0])
+
+    def get_str(self):
+        payload = self._get_bytes()
+        if payload is None:
+            return None
+        return payload.decode("utf-8")
 
     def get(self):
-        resp_str = self.get_str()
-        if resp_str is None:
+        payload = self._get_bytes()
+        if payload is None:
             return None
-        return json.loads(resp_str)
+        return json_loads(payload)
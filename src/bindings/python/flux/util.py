@@ -100,27 +100,30 @@ def interruptible(func):
 
 
 def encode_payload(payload):
+    # check bytes first so pre-encoded payloads pass through with a
+    # single isinstance test
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode("UTF-8", errors="surrogateescape")
     if payload is None or payload == ffi.NULL:
-        payload = ffi.NULL
-    elif isinstance(payload, str):
-        payload = payload.encode("UTF-8", errors="surrogateescape")
-    elif not isinstance(payload, bytes):
-        payload = json.dumps(payload, ensure_ascii=False).encode(
-            "UTF-8", errors="surrogateescape"
-        )
-    return payload
+        return ffi.NULL
+    return json.dumps(payload, ensure_ascii=False).encode(
+        "UTF-8", errors="surrogateescape"
+    )
 
 
 def encode_topic(topic):
-    # Convert topic to utf-8 binary string
+    # Convert topic to utf-8 binary string, passing pre-encoded bytes
+    # through after a single isinstance test
+    if isinstance(topic, bytes):
+        return topic
+    if isinstance(topic, str):
+        return topic.encode("UTF-8")
     if topic is None or topic == ffi.NULL:
         raise EnvironmentError(errno.EINVAL, "Topic must not be None/NULL")
-    if isinstance(topic, str):
-        topic = topic.encode("UTF-8")
-    elif not isinstance(topic, bytes):
-        errmsg = "Topic must be a string, not {}".format(type(topic))
-        raise TypeError(errno.EINVAL, errmsg)
-    return topic
+    errmsg = "Topic must be a string, not {}".format(type(topic))
+    raise TypeError(errno.EINVAL, errmsg)
 
 
 def help_formatter(argwidth=40, raw_description=False):
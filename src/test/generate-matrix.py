@@ -3,9 +3,16 @@
 #  Generate a build matrix for use with github workflows
 #
 
-import json
 import os
-import re
+
+#  Use orjson for serialization if available (compact by default and much
+#  faster than stdlib json), otherwise fall back to stdlib json.
+try:
+    import orjson
+except ImportError:
+    import json
+
+    orjson = None
 
 docker_run_checks = "src/test/docker/docker-run-checks.sh"
 
@@ -18,8 +25,27 @@ default_args = (
     " --enable-caliper"
 )
 
+#  Same as default_args but without caliper, for images where caliper
+#  does not compile:
+args_no_caliper = (
+    "--prefix=/usr"
+    " --sysconfdir=/etc"
+    " --with-systemdsystemunitdir=/etc/systemd/system"
+    " --localstatedir=/var"
+    " --with-flux-security"
+)
+
 DOCKER_REPO = "fluxrm/flux-core"
 
+#  Environment needed to test the content-s3 module.  This never varies
+#  between builds, so build the dict once at module scope:
+s3_env = dict(
+    S3_ACCESS_KEY_ID="minioadmin",
+    S3_SECRET_ACCESS_KEY="minioadmin",
+    S3_HOSTNAME="127.0.0.1:9000",
+    S3_BUCKET="flux-minio",
+)
+
 
 class BuildMatrix:
     def __init__(self):
@@ -28,39 +54,36 @@ class BuildMatrix:
         self.tag = None
 
         #  Set self.branch or self.tag based on GITHUB_REF
-        if "GITHUB_REF" in os.environ:
-            self.ref = os.environ["GITHUB_REF"]
-            match = re.search("^refs/heads/(.*)", self.ref)
-            if match:
-                self.branch = match.group(1)
-            match = re.search("^refs/tags/(.*)", self.ref)
-            if match:
-                self.tag = match.group(1)
-
-    def create_docker_tag(self, image, env, command, platform):
+        ref = os.environ.get("GITHUB_REF")
+        if ref is not None:
+            self.ref = ref
+            if ref.startswith("refs/"):
+                kind, _, name = ref[len("refs/") :].partition("/")
+                if kind == "heads":
+                    self.branch = name
+                elif kind == "tags":
+                    self.tag = name
+
+        #  Docker images are only tagged on the master branch or a tag.
+        #  branch/tag never change after init, so decide this once:
+        self.create_tag = self.branch == "master" or bool(self.tag)
+
+    def create_docker_tag(self, image, env, platform):
         """Create docker tag string if this is master branch or a tag"""
-        if self.branch == "master" or self.tag:
+        if self.create_tag:
             tag = f"{DOCKER_REPO}:{image}"
             if self.tag:
                 tag += f"-{self.tag}"
             if platform is not None:
                 tag += "-" + platform.split("/")[1]
             env["DOCKER_TAG"] = tag
-            command += f" --tag={tag}"
-            return True, command
+            return True, f" --tag={tag}"
 
-        return False, command
+        return False, ""
 
     def env_add_s3(self, args, env):
         """Add necessary environment and args to test content-s3 module"""
-        env.update(
-            dict(
-                S3_ACCESS_KEY_ID="minioadmin",
-                S3_SECRET_ACCESS_KEY="minioadmin",
-                S3_HOSTNAME="127.0.0.1:9000",
-                S3_BUCKET="flux-minio",
-            )
-        )
+        env.update(s3_env)
         args += " --enable-content-s3"
         return args
 
@@ -89,16 +112,13 @@ class BuildMatrix:
             command_args += f"--platform={platform}"
             needs_buildx = True
 
-        # The command to run:
-        command = f"{docker_run_checks} -j{jobs} --image={image} {command_args}"
-
         # Add --recheck option if requested
-        if recheck and "DISTCHECK" not in env:
-            command += " --recheck"
+        recheck_arg = " --recheck" if recheck and "DISTCHECK" not in env else ""
 
+        tag_arg = ""
         if docker_tag:
             #  Only export docker_tag if this is main branch or a tag:
-            docker_tag, command = self.create_docker_tag(image, env, command, platform)
+            docker_tag, tag_arg = self.create_docker_tag(image, env, platform)
 
         if test_s3:
             args = self.env_add_s3(args, env)
@@ -110,7 +130,11 @@ class BuildMatrix:
         if self.tag and "DISTCHECK" in env:
             create_release = True
 
-        command += f" -- --enable-docs {args}"
+        # The command to run, assembled in a single pass:
+        command = (
+            f"{docker_run_checks} -j{jobs} --image={image} "
+            f"{command_args}{recheck_arg}{tag_arg} -- --enable-docs {args}"
+        )
 
         self.matrix.append(
             {
@@ -131,8 +155,14 @@ class BuildMatrix:
 
     def __str__(self):
         """Return compact JSON representation of matrix"""
-        return json.dumps(
-            {"include": self.matrix}, skipkeys=True, separators=(",", ":")
+        #  Serialize the include list directly and splice in the literal
+        #  framing, avoiding a throwaway single-key wrapper dict:
+        if orjson is not None:
+            return '{"include":' + orjson.dumps(self.matrix).decode() + "}"
+        return (
+            '{"include":'
+            + json.dumps(self.matrix, skipkeys=True, separators=(",", ":"))
+            + "}"
         )
 
 
@@ -150,7 +180,7 @@ matrix.add_build(
 )
 
 # Debian: arm64, expensive, only on master and tags, only install
-if matrix.branch == "master" or matrix.tag:
+if matrix.create_tag:
     matrix.add_build(
         name="bookworm - arm64",
         image="bookworm",
@@ -260,13 +290,7 @@ matrix.add_build(
 matrix.add_build(
     name="fedora38 - gcc-13.1,py3.11",
     image="fedora38",
-    args=(
-        "--prefix=/usr"
-        " --sysconfdir=/etc"
-        " --with-systemdsystemunitdir=/etc/systemd/system"
-        " --localstatedir=/var"
-        " --with-flux-security"
-    ),
+    args=args_no_caliper,
     docker_tag=True,
 )
 
@@ -275,13 +299,7 @@ matrix.add_build(
 matrix.add_build(
     name="fedora39 - gcc-13.2,py3.12",
     image="fedora39",
-    args=(
-        "--prefix=/usr"
-        " --sysconfdir=/etc"
-        " --with-systemdsystemunitdir=/etc/systemd/system"
-        " --localstatedir=/var"
-        " --with-flux-security"
-    ),
+    args=args_no_caliper,
     env=dict(PSM3_HAL="loopback"),
     docker_tag=True,
 )
@@ -289,13 +307,7 @@ matrix.add_build(
 matrix.add_build(
     name="alpine",
     image="alpine",
-    args=(
-        "--prefix=/usr"
-        " --sysconfdir=/etc"
-        " --with-systemdsystemunitdir=/etc/systemd/system"
-        " --localstatedir=/var"
-        " --with-flux-security"
-    ),
+    args=args_no_caliper,
     docker_tag=True,
 )
 
@@ -29,22 +29,32 @@ if len(sys.argv) == 3:
 # Open connection to broker
 h = flux.Flux()
 
-jobspec = JobspecV1.from_command(["/bin/true"])
+# Serialize and encode the jobspec once up front; job.submit() passes
+# bytes straight through, so no per-submission serialization or encode
+# remains in the loop below.
+jobspec = JobspecV1.from_command(["/bin/true"]).dumps().encode("utf-8")
 done = 0
 running = 0
 
 while done < njobs:
-    if running < fanout and done + running < njobs:
-        jobid = job.submit(h, jobspec, waitable=True)
-        print("submit: {}".format(jobid))
+    # Top up the window with async submissions so the requests overlap,
+    # then collect the assigned jobids from the futures:
+    futures = []
+    while running < fanout and done + running < njobs:
+        futures.append(job.submit_async(h, jobspec, waitable=True))
         running += 1
+    if futures:
+        # One buffered write for the whole batch instead of a print per job
+        sys.stdout.write(
+            "".join("submit: {}\n".format(future.get_id()) for future in futures)
+        )
 
     if running == fanout or done + running == njobs:
         jobid, success, errstr = job.wait(h)
         if success:
-            print("wait: {} Success".format(jobid))
+            sys.stdout.write("wait: {} Success\n".format(jobid))
         else:
-            print("wait: {} Error: {}".format(jobid, errstr))
+            sys.stdout.write("wait: {} Error: {}\n".format(jobid, errstr))
         done += 1
         running -= 1
 